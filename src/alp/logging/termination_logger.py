@@ -6,6 +6,30 @@ import json
 import logging
 import os
 import uuid
+import weakref
+
+_LOGGER = logging.getLogger("termination_logger")
+
+_CONSOLE_FORMATTER = logging.Formatter('%(message)s')
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(message)s')
+
+def _console_enabled(record: logging.LogRecord) -> bool:
+    """Drop records from instances that disabled console logging."""
+    return getattr(record, "termination_to_console", True)
+
+class _InstanceFilter(logging.Filter):
+    """Pass only records logged by one TerminationLogger instance."""
+    def __init__(self, owner_id: int):
+        super().__init__()
+        self.owner_id = owner_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "termination_logger_id", self.owner_id) == self.owner_id
+
+def _detach_handler(logger: logging.Logger, handler: logging.Handler) -> None:
+    """Remove ``handler`` from ``logger`` and close it."""
+    logger.removeHandler(handler)
+    handler.close()
 
 class TerminationReason(Enum):
     MAX_ITERATIONS = auto()
@@ -74,24 +98,43 @@ class TerminationLogger:
             log_to_file: Enable file logging
         """
         self.log_dir = log_dir
+        self.log_to_console = log_to_console
         os.makedirs(log_dir, exist_ok=True)
         
-        # Configure loggers
-        self.logger = logging.getLogger("termination_logger")
-        self.logger.setLevel(logging.INFO)
+        # Configure loggers (setLevel takes the logging lock, so only
+        # reset the level when something has changed it)
+        self.logger = _LOGGER
+        if self.logger.level != logging.INFO:
+            self.logger.setLevel(logging.INFO)
         
-        # Console handler
-        if log_to_console:
+        # Console handler, shared by all instances so messages are not
+        # repeated once per instance
+        if log_to_console and not any(
+            _console_enabled in handler.filters for handler in self.logger.handlers
+        ):
             console_handler = logging.StreamHandler()
-            console_handler.setFormatter(logging.Formatter('%(message)s'))
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            console_handler.addFilter(_console_enabled)
             self.logger.addHandler(console_handler)
         
-        # File handler
+        # File handler, receiving only this instance's events
+        self._finalizer = None
         if log_to_file:
             log_file = os.path.join(log_dir, f"termination_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
             file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+            file_handler.setFormatter(_FILE_FORMATTER)
+            file_handler.addFilter(_InstanceFilter(id(self)))
             self.logger.addHandler(file_handler)
+            self._finalizer = weakref.finalize(
+                self, _detach_handler, self.logger, file_handler
+            )
+    
+    def close(self) -> None:
+        """
+        Detach and close this instance's file handler, releasing the log file.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
     
     def log_termination(
         self, 
@@ -128,13 +171,16 @@ class TerminationLogger:
         with open(json_log_path, 'w') as f:
             json.dump(event.to_dict(), f, indent=2)
         
-        # Log to configured outputs
-        log_message = (
-            f"ALP Loop Terminated: "
-            f"Reason={reason.name}, "
-            f"Iterations={iteration_count}, "
-            f"Metrics={performance_metrics}"
+        # Log to configured outputs (formatted lazily, only if a handler emits it)
+        self.logger.info(
+            "ALP Loop Terminated: Reason=%s, Iterations=%s, Metrics=%s",
+            reason.name,
+            iteration_count,
+            performance_metrics,
+            extra={
+                "termination_logger_id": id(self),
+                "termination_to_console": self.log_to_console
+            }
         )
-        self.logger.info(log_message)
         
         return json_log_path
\ No newline at end of file
@@ -42,7 +42,8 @@ class TerminationConditions:
         self.current_iteration += 1
 
         # Update best performance if current performance is better
-        self.best_performance = max(self.best_performance, current_performance)
+        if current_performance > self.best_performance:
+            self.best_performance = current_performance
 
         # Check termination conditions
         if self.current_iteration >= self.max_iterations:
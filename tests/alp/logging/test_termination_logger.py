@@ -98,4 +98,58 @@ def test_event_serialization():
     assert "performance_metrics" in event_dict
     assert "additional_context" in event_dict
     assert event_dict["reason"] == "ERROR"
-    assert event_dict["event_id"] is not None
\ No newline at end of file
+    assert event_dict["event_id"] is not None
+
+def test_console_handler_not_duplicated(temp_log_dir):
+    """Test that repeated instances share one console handler."""
+    first = TerminationLogger(log_dir=temp_log_dir, log_to_file=False)
+    second = TerminationLogger(log_dir=temp_log_dir, log_to_file=False)
+
+    console_handlers = [
+        h for h in second.logger.handlers if type(h) is logging.StreamHandler
+    ]
+    assert first.logger is second.logger
+    assert len(console_handlers) == 1
+
+def test_instances_write_only_their_own_log_file(tmp_path):
+    """Test that one instance's events never reach another instance's log file."""
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first = TerminationLogger(log_dir=str(first_dir), log_to_console=False)
+    second = TerminationLogger(log_dir=str(second_dir), log_to_console=False)
+
+    second.log_termination(
+        reason=TerminationReason.MANUAL_STOP,
+        iteration_count=7,
+        performance_metrics={"loss": 0.1}
+    )
+    first.close()
+    second.close()
+
+    first_logs = [f for f in os.listdir(first_dir) if f.endswith('.log')]
+    second_logs = [f for f in os.listdir(second_dir) if f.endswith('.log')]
+    assert (first_dir / first_logs[0]).read_text() == ""
+    assert "MANUAL_STOP" in (second_dir / second_logs[0]).read_text()
+
+def test_close_releases_file_handler(temp_log_dir):
+    """Test that close detaches and closes the instance's file handler."""
+    logger = TerminationLogger(log_dir=temp_log_dir, log_to_console=False)
+    file_handlers = [
+        h for h in logger.logger.handlers
+        if isinstance(h, logging.FileHandler)
+        and h.baseFilename.startswith(temp_log_dir)
+    ]
+    assert len(file_handlers) == 1
+
+    logger.close()
+
+    assert file_handlers[0] not in logger.logger.handlers
+    assert file_handlers[0].stream is None
+
+def test_initialization_restores_info_level(temp_log_dir):
+    """Test that a new instance resets a lowered logger level to INFO."""
+    logging.getLogger("termination_logger").setLevel(logging.CRITICAL)
+
+    logger = TerminationLogger(log_dir=temp_log_dir, log_to_file=False)
+
+    assert logger.logger.level == logging.INFO